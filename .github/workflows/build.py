@@ -24,28 +24,90 @@ To add a new feed-driven category:
   3. Add category name to CATEGORY_ORDER in build_home()
   4. Commit and push
 """
-import os, json, re, time
+import os, json, re, time, hashlib, heapq, shutil, threading, functools, operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from html import unescape
+from urllib.parse import urlparse, urlsplit, parse_qsl, urlencode
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from slugify import slugify
-from jinja2 import Template
+try:
+    from selectolax.parser import HTMLParser  # C (Modest) parser, much faster than bs4
+except ImportError:
+    HTMLParser = None
+try:
+    from lxml import etree as lxml_etree, html as lxml_html  # libxml2, used directly rather than via bs4
+    # Raised on comment-only / empty markup and on str input that carries an
+    # XML encoding declaration; bs4 copes with both
+    _LXML_ERRORS = (lxml_etree.ParserError, ValueError)
+except ImportError:
+    lxml_html = None
+try:
+    import orjson  # Rust-backed, several times faster than stdlib json
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from datetime import datetime, timezone
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 DATA = os.path.join(ROOT, 'data', 'feeds.json')
 META = os.path.join(ROOT, 'data', 'meta.json')
 SITE = os.path.join(ROOT, 'docs')
+FEED_CACHE = os.path.join(ROOT, 'data', 'feed_cache.json')
+ITEM_CACHE = os.path.join(SITE, '.item_cache.json')
+ITEM_CACHE_MAX_AGE = 7 * 86400
+BUILD_SIGS = os.path.join(SITE, '.build_sigs.json')
+JINJA_CACHE = os.path.join(ROOT, '.jinja_cache')
 SITE_URL = 'https://www.thetechbrief.net'
 
+STATIC_HARDLINK = os.environ.get('STATIC_HARDLINK') == '1'   # link static_dirs files instead of copying
+
+FETCH_WORKERS  = 16   # concurrent feed downloads
+FETCH_PER_HOST = 2    # max in-flight requests to any one host
+FETCH_TIMEOUT  = 10   # seconds; a stalled feed must not hang the build
+USER_AGENT     = 'TheTechBrief/1.0 (+https://www.thetechbrief.net)'
+
 # ── Load templates & data ──────────────────────────────────────────────────
-with open(os.path.join(ROOT, 'site', 'template_category.html'), 'r', encoding='utf-8') as f:
-    CATEGORY_TPL = Template(f.read())
-with open(os.path.join(ROOT, 'site', 'template_home.html'), 'r', encoding='utf-8') as f:
-    HOME_TPL = Template(f.read())
-with open(DATA, 'r', encoding='utf-8') as f:
-    FEEDS = json.load(f)
-with open(META, 'r', encoding='utf-8') as f:
-    META_MAP = json.load(f)
+# Compiled template bytecode is kept in .jinja_cache/ (cached by CI) so
+# repeat builds skip Jinja's parse/compile step.
+os.makedirs(JINJA_CACHE, exist_ok=True)
+JINJA_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(ROOT, 'site')),
+    bytecode_cache=FileSystemBytecodeCache(directory=JINJA_CACHE),
+    auto_reload=False,
+    # Drop the whitespace-only lines standalone {% %} tags would leave behind
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+CATEGORY_TPL = JINJA_ENV.get_template('template_category.html')
+HOME_TPL = JINJA_ENV.get_template('template_home.html')
+# Salt for the render-skip signatures: anything besides the page data that
+# changes the output — template source, Environment whitespace/escaping
+# options and this script's own code — must invalidate pages signed before.
+with open(__file__, 'rb') as f:
+    _BUILD_CODE = f.read()
+_ENV_OPTS = (JINJA_ENV.trim_blocks, JINJA_ENV.lstrip_blocks, JINJA_ENV.keep_trailing_newline,
+             JINJA_ENV.newline_sequence, JINJA_ENV.autoescape)
+CATEGORY_TPL_SRC_SIG = hashlib.blake2b(
+    JINJA_ENV.loader.get_source(JINJA_ENV, 'template_category.html')[0].encode('utf-8')
+    + repr(_ENV_OPTS).encode('utf-8') + _BUILD_CODE,
+    digest_size=16).hexdigest()
+with open(DATA, 'rb') as f:
+    FEEDS = _json_loads(f.read())
+with open(META, 'rb') as f:
+    META_MAP = _json_loads(f.read())
 
 
 # ── Load generated editorial articles ─────────────────────────────────────
@@ -54,59 +116,190 @@ def load_editorial_articles():
     if not os.path.exists(path):
         return []
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
     except Exception:
         return []
 
 
+# ── Build caches ───────────────────────────────────────────────────────────
+# FEED_CACHE: url -> {etag, modified, entries} for conditional GET
+# ITEM_CACHE: blake2b(link) -> {summary, image, ...} so only new entries
+#             pay for clean_text / summarize_text / first_image
+def load_json_cache(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    except Exception:
+        return {}
+
+
+def save_json_cache(path, cache):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_json_dumps(cache))
+
+
+def _item_key(link):
+    return hashlib.blake2b(link.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _page_sig(*parts):
+    # Fingerprint of everything a page render depends on
+    # (Article records fall through to default=str, i.e. their field repr)
+    blob = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.blake2b(blob.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def prune_item_cache(cache, now):
+    for key in [k for k, v in cache.items() if now - v.get('seen', 0) > ITEM_CACHE_MAX_AGE]:
+        del cache[key]
+
+
 # ── Text helpers ───────────────────────────────────────────────────────────
+_WS_RE   = re.compile(r"\s+")
+_TAG_RE  = re.compile(r'<[^>]+>')
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+SUMMARIZE_MIN_CHARS = 600   # typical RSS summaries are shorter than this
+
+_SUMY = None   # (PlaintextParser, Tokenizer, TextRankSummarizer) once loaded, False if unavailable
+
 
-def clean_text(html):
-    txt = BeautifulSoup(html or '', 'html.parser').get_text(' ')
-    return re.sub(r"\s+", " ", txt).strip()
+def _get_sumy():
+    # sumy + NLTK are slow to import, and with the item cache most runs never
+    # summarize anything — so set them up on first use, once per process.
+    global _SUMY
+    if _SUMY is None:
+        try:
+            from sumy.parsers.plaintext import PlaintextParser
+            from sumy.nlp.tokenizers import Tokenizer
+            from sumy.summarizers.text_rank import TextRankSummarizer
+            _SUMY = (PlaintextParser, Tokenizer('english'), TextRankSummarizer())
+        except Exception:  # sumy missing or NLTK punkt data not downloaded
+            _SUMY = False
+    return _SUMY
+
+
+def clean_text(html, tree=None):
+    # tree: an already-parsed selectolax tree of html, if the caller has one
+    if not html:
+        return ''
+    if HTMLParser is not None:
+        txt = (tree or HTMLParser(html)).text(separator=' ')
+    else:
+        # No tree needed just to drop tags; replacing each tag with a space
+        # keeps words in adjacent blocks apart, as get_text(' ') did.
+        txt = unescape(_TAG_RE.sub(' ', html))
+    return _WS_RE.sub(' ', txt).strip()
 
 
+@functools.lru_cache(maxsize=2048)
 def summarize_text(text, sentences=2):
     text = (text or '').strip()
     if not text:
         return ''
-    try:
-        from sumy.parsers.plaintext import PlaintextParser
-        from sumy.nlp.tokenizers import Tokenizer
-        from sumy.summarizers.text_rank import TextRankSummarizer
-        parser = PlaintextParser.from_string(text, Tokenizer('english'))
-        summarizer = TextRankSummarizer()
-        result = summarizer(parser.document, sentences)
-        if result:
-            return ' '.join(str(s) for s in result)
-    except Exception:
-        pass
-    parts = re.split(r'(?<=[.!?])\s+', text)
+    parts = _SENT_RE.split(text)
+    # TextRank is O(sentences²) and can't beat the lead sentences of a short
+    # snippet, so only run it on genuinely long descriptions.
+    sumy = len(parts) > sentences and len(text) >= SUMMARIZE_MIN_CHARS and _get_sumy()
+    if sumy:
+        parser_cls, tokenizer, summarizer = sumy
+        try:
+            result = summarizer(parser_cls.from_string(text, tokenizer).document, sentences)
+            if result:
+                return ' '.join(str(s) for s in result)
+        except Exception:
+            pass
     joined = ' '.join(parts[:sentences])
     return joined if joined else text[:280]
 
 
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+@functools.lru_cache(maxsize=None)
+def _slug(text):
+    if text.isascii():
+        return _SLUG_RE.sub('-', text.lower()).strip('-')
+    from slugify import slugify  # only non-ASCII names need transliteration
+    return slugify(text)
+
+
+def _category_meta(category):
+    # meta.json entry with a slug guaranteed, or a bare default for new categories
+    meta = META_MAP.get(category)
+    if meta is None:
+        meta = {'title': category, 'description': category, 'h1': category, 'h2': ''}
+    meta = dict(meta)
+    meta.setdefault('slug', _slug(category))
+    return meta
+
+
+# Page metadata per feed category, resolved once instead of on every build_category call
+_CATEGORY_META = {cat: _category_meta(cat) for cat in FEEDS}
+
+
 # ── Image extraction ───────────────────────────────────────────────────────
+# First <img> tag (a '>' inside a quoted value doesn't end it), then its
+# quoted attributes in _pick_img_tag's order: src, data-src, data-original,
+# and the first srcset candidate. Each quote style is matched separately so
+# a ' inside a "..." value (or vice versa) doesn't end it.
+_IMG_TAG_RE   = re.compile(r'''<img\b(?:[^>"']|"[^"]*"|'[^']*')*>''', re.I)
+_IMG_ATTR_RES = tuple(
+    re.compile(r'''(?<=\s)%s\s*=\s*(?:"([^"]+)"|'([^']+)')''' % attr, re.I)
+    for attr in ('src', 'data-src', 'data-original')
+) + (re.compile(r'''(?<=\s)srcset\s*=\s*(?:"\s*([^"\s]+)|'\s*([^'\s]+))''', re.I),)
+_IMG_EXT_RE = re.compile(r'^[^?#]*\.(?:jpe?g|png|webp|gif)(?:[?#]|$)', re.I)   # path ends in an image ext
 
 def _looks_like_image(url):
-    if not url:
-        return False
-    from urllib.parse import urlparse
-    path = urlparse(url).path.lower()
-    return any(path.endswith(ext) for ext in ('.jpg', '.jpeg', '.png', '.webp', '.gif'))
+    return bool(url and _IMG_EXT_RE.match(url))
+
+
+def _find_img_tag(html, tree=None):
+    # Returns something with .get(attr): selectolax attributes dict, an lxml
+    # element or a bs4 Tag, from the fastest parser installed
+    if HTMLParser is not None:
+        node = (tree or HTMLParser(html)).css_first('img')
+        return node.attributes if node is not None else None
+    if lxml_html is not None:
+        try:
+            # iter() includes the root, which is the <img> itself for a bare tag
+            return next(lxml_html.fromstring(html).iter('img'), None)
+        except _LXML_ERRORS:
+            pass
+    return BeautifulSoup(html, 'html.parser').find('img')
 
 
 def _pick_img_tag(img):
+    # lxml elements without children are falsy, so compare against None
+    if img is None:
+        return None
     for attr in ('src', 'data-src', 'data-original'):
-        if img and img.get(attr):
+        if img.get(attr):
             return img.get(attr)
-    if img and img.get('srcset'):
+    if img.get('srcset'):
         return img.get('srcset').split()[0]
     return None
 
 
-def first_image(entry):
+def _img_from_html(html, tree=None):
+    # Regexes find the first <img> without building a tree; only odd markup
+    # (e.g. unquoted attributes) needs the real parser.
+    m = _IMG_TAG_RE.search(html)
+    if not m:
+        return None
+    tag = m.group(0)
+    for attr_re in _IMG_ATTR_RES:
+        a = attr_re.search(tag)
+        if a:
+            # Raw attribute text: decode entities as the parsers do
+            return unescape(a.group(1) or a.group(2))
+    return _pick_img_tag(_find_img_tag(html, tree))
+
+
+def first_image(entry, desc_tree=None):
     for m in (entry.get('media_content') or []):
         if _looks_like_image(m.get('url')):
             return m['url']
@@ -117,19 +310,19 @@ def first_image(entry):
         url = e.get('href') or e.get('url')
         if _looks_like_image(url) or 'image' in (e.get('type') or ''):
             return url
-    for c in (entry.get('content') or []):
-        html = c.get('value') or c.get('content') or ''
-        img = BeautifulSoup(html, 'html.parser').find('img')
-        url = _pick_img_tag(img)
-        if url:
-            return url
+    # One scan over <content> blocks + summary, in the old lookup order
     desc = entry.get('summary') or entry.get('description') or ''
+    blobs = [c.get('value') or c.get('content') or '' for c in (entry.get('content') or [])]
+    # Blank fragments can't hold an <img>; drop them before any scan
+    blobs = [b for b in blobs if b and not b.isspace()]
+    if desc.isspace():
+        desc = ''
+    if not blobs:
+        # Summary only, so desc_tree (the caller's parse of it) can be reused
+        return _img_from_html(desc, desc_tree) if desc else None
     if desc:
-        img = BeautifulSoup(desc, 'html.parser').find('img')
-        url = _pick_img_tag(img)
-        if url:
-            return url
-    return None
+        blobs.append(desc)
+    return _img_from_html(' '.join(blobs))
 
 
 # ── Copyright-safe image handling ─────────────────────────────────────────
@@ -142,6 +335,17 @@ SAFE_IMAGE_DOMAINS = (
     'samsung.com/press',
     'google.com/press',
 )
+# One C-level match instead of urlparse + a Python loop per card. Also
+# honours the path-scoped entries above, which a netloc compare never could.
+# Only a numeric port may follow the domain: 'safe.host:1@evil.com' is
+# userinfo for evil.com, not a safe host. Protocol-relative //host URLs
+# pass, as they did with the urlparse check.
+_SAFE_HOST_RE = re.compile(
+    r'^(?:https?:)?//(?:[^/?#]*\.)?('
+    + '|'.join(re.escape(d) for d in SAFE_IMAGE_DOMAINS)
+    + r')(?::\d+)?(?:[/?#]|$)',
+    re.I,
+)
 
 CATEGORY_IMAGE_POOLS = {
     'ai-news': [
@@ -227,37 +431,36 @@ CATEGORY_IMAGE_POOLS = {
 }
 
 
+# Full fallback URLs, built once rather than formatted per card
+CATEGORY_IMAGE_URLS = {
+    slug: [f'https://images.unsplash.com/{photo_id}?w=800&auto=format&fit=crop' for photo_id in pool]
+    for slug, pool in CATEGORY_IMAGE_POOLS.items()
+}
+
+
 def is_safe_image(url):
-    if not url:
-        return False
-    from urllib.parse import urlparse
-    host = urlparse(url).netloc.lower().lstrip('www.')
-    return any(host == d or host.endswith('.' + d) for d in SAFE_IMAGE_DOMAINS)
+    return bool(url and _SAFE_HOST_RE.match(url))
 
 
 def copyright_safe_image(url, category_slug='default', article_key=''):
     if is_safe_image(url):
         return url
-    import hashlib
-    pool = CATEGORY_IMAGE_POOLS.get(category_slug, CATEGORY_IMAGE_POOLS['default'])
+    pool = CATEGORY_IMAGE_URLS.get(category_slug, CATEGORY_IMAGE_URLS['default'])
     seed = (article_key or category_slug).encode('utf-8')
-    idx  = int(hashlib.md5(seed).hexdigest(), 16) % len(pool)
-    photo_id = pool[idx]
-    return f'https://images.unsplash.com/{photo_id}?w=800&auto=format&fit=crop'
+    idx  = int.from_bytes(hashlib.blake2b(seed, digest_size=8).digest(), 'big') % len(pool)
+    return pool[idx]
 
 
 def assign_unique_images(items, category_slug):
-    pool = CATEGORY_IMAGE_POOLS.get(category_slug, CATEGORY_IMAGE_POOLS['default'])
+    pool = CATEGORY_IMAGE_URLS.get(category_slug, CATEGORY_IMAGE_URLS['default'])
     pool_len = len(pool)
     pool_cursor = 0
+    safe_match = _SAFE_HOST_RE.match
     for item in items:
-        original_url = item.get('image')
-        if is_safe_image(original_url):
-            item['image'] = original_url
-        else:
-            photo_id = pool[pool_cursor % pool_len]
+        original_url = item.image
+        if not (original_url and safe_match(original_url)):
+            item.image = pool[pool_cursor % pool_len]
             pool_cursor += 1
-            item['image'] = f'https://images.unsplash.com/{photo_id}?w=800&auto=format&fit=crop'
     return items
 
 
@@ -266,17 +469,79 @@ def parse_time(entry):
     return time.mktime(t) if t else 0
 
 
+_BY_TS = operator.attrgetter('ts')
+
+
+# Every UTC offset in use is a whole number of quarter-hours, so all
+# timestamps in one 15-minute slot share a local date. Keying the cache on
+# the slot (rather than ts // 86400, a UTC day) keeps it correct off UTC.
+_DATE_SLOT = 900
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_date_slot(slot):
+    return time.strftime('%B %d, %Y', time.localtime(slot * _DATE_SLOT))
+
+
 def fmt_date(ts):
     if not ts:
         return ''
-    return time.strftime('%B %d, %Y', time.localtime(ts))
+    return _fmt_date_slot(int(ts // _DATE_SLOT))
 
 
 # ── Sync static assets from site/ → docs/ ─────────────────────────────────
 
-def sync_static_assets():
-    import shutil
+def _sync_file(src, dst, st=None, link=False):
+    # Copy src → dst unless dst already has the same size and is not older.
+    # link: hardlink instead of copying; only safe for files the build never
+    # writes to afterwards, or the write would go through to site/ as well.
+    st = st or os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+        # A dst still hardlinked to src from an earlier run counts as stale
+        # when linking isn't allowed, so it gets split into its own copy
+        shared = (dst_st.st_ino, dst_st.st_dev) == (st.st_ino, st.st_dev)
+        if dst_st.st_size == st.st_size and dst_st.st_mtime_ns >= st.st_mtime_ns and (link or not shared):
+            return False
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    if link:
+        try:
+            os.link(src, dst)
+            return True
+        except OSError:
+            pass
+    # copyfile skips copy2's utime/xattr syscalls and already uses
+    # os.sendfile() for a zero-copy transfer on Linux
+    shutil.copyfile(src, dst)
+    return True
+
+
+def _sync_tree(src, dst):
+    # Mirror src into dst: copy new/modified files, drop ones no longer in src
+    os.makedirs(dst, exist_ok=True)
+    seen = set()
+    copied = 0
+    with os.scandir(src) as it:
+        for entry in it:
+            seen.add(entry.name)
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                copied += _sync_tree(entry.path, target)
+            else:
+                copied += _sync_file(entry.path, target, entry.stat(), link=STATIC_HARDLINK)
+    for name in os.listdir(dst):
+        if name not in seen:
+            path = os.path.join(dst, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+    return copied
+
 
+def sync_static_assets():
     static_dirs = ['assets', 'legal', 'articles']
 
     static_files = [
@@ -291,56 +556,197 @@ def sync_static_assets():
 
     src_root = os.path.join(ROOT, 'site')
 
+    # Only static_dirs may be hardlinked (STATIC_HARDLINK=1); static_files
+    # include sitemap.xml and robots.txt, which build_sitemap() rewrites in
+    # place and would otherwise clobber the sources in site/.
+    copied = 0
     for d in static_dirs:
         src = os.path.join(src_root, d)
-        dst = os.path.join(SITE, d)
         if os.path.isdir(src):
-            if os.path.exists(dst):
-                shutil.rmtree(dst)
-            shutil.copytree(src, dst)
+            copied += _sync_tree(src, os.path.join(SITE, d))
 
     for fname in static_files:
         src = os.path.join(src_root, fname)
         if os.path.isfile(src):
-            import shutil as sh
-            sh.copy2(src, os.path.join(SITE, fname))
+            copied += _sync_file(src, os.path.join(SITE, fname))
         else:
             print(f'  WARNING: static file not found in site/: {fname}')
+    print(f'  {copied} static file(s) updated')
+
+
+# ── Feed fetching ──────────────────────────────────────────────────────────
+
+# One pooled session for every feed: keep-alive and TLS sessions are reused
+# across feeds on the same host, which feedparser's own urllib fetch can't do
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = USER_AGENT
+_SESSION.mount('https://', HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS))
+_SESSION.mount('http://',  HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS))
+
+
+def _fetch(url, host_limits, cached=None):
+    cached = cached or {}
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('modified'):
+        headers['If-Modified-Since'] = cached['modified']
+    with host_limits[urlparse(url).netloc.lower()]:
+        r = _SESSION.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    if r.status_code == 304:
+        return feedparser.FeedParserDict(status=304, entries=[])
+    r.raise_for_status()
+    # content-location gives feedparser the base URL for relative links.
+    # Entry HTML is reduced to text / a single <img> by our own helpers,
+    # so feedparser's sanitizer and URI rewriting would be wasted work.
+    resp_headers = {k.lower(): v for k, v in r.headers.items()}
+    resp_headers['content-location'] = r.url
+    feed = feedparser.parse(
+        r.content, response_headers=resp_headers,
+        resolve_relative_uris=False, sanitize_html=False,
+    )
+    feed['status'] = r.status_code
+    feed['etag'], feed['modified'] = r.headers.get('ETag'), r.headers.get('Last-Modified')
+    return feed
+
+
+def fetch_feeds(feeds, feed_cache):
+    """Download every feed concurrently. Returns {category: [(url, feed), ...]}.
+
+    Sends the ETag / Last-Modified stored in feed_cache so unchanged feeds
+    come back as HTTP 304 with no body.
+    """
+    pairs = [(cat, url) for cat, urls in feeds.items() for url in urls]
+    host_limits = {
+        urlparse(url).netloc.lower(): threading.BoundedSemaphore(FETCH_PER_HOST)
+        for _, url in pairs
+    }
+    fetched = {cat: [] for cat in feeds}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        jobs = [(cat, url, pool.submit(_fetch, url, host_limits, feed_cache.get(url))) for cat, url in pairs]
+        for cat, url, job in jobs:
+            try:
+                fetched[cat].append((url, job.result()))
+            except Exception as ex:
+                print(f'  Feed error {url}: {ex}')
+    return fetched
 
 
 # ── Category builder ───────────────────────────────────────────────────────
 
-def build_category(category, urls, editorial_articles):
-    items = []
-    for url in urls:
-        try:
-            feed = feedparser.parse(url)
-        except Exception as ex:
-            print(f'  Feed error {url}: {ex}')
+@dataclass(slots=True)
+class Article:
+    # One feed card. Jinja's card.title / card['title'] both resolve to the
+    # attribute, so templates work the same as with the old dicts.
+    title: str
+    link: str
+    source: str
+    summary: str
+    image: str | None
+    ts: float
+    date: str
+    category: str
+    commentary: str = ''
+    is_editorial: bool = False
+
+
+# Syndicated copies of a story often differ only by tracking params, a
+# fragment, scheme or trailing slash; dedupe on the link without those.
+def _link_key(link):
+    parts = urlsplit(link)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not k.startswith('utm_')]) if parts.query else ''
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{query}"
+
+
+_ENTRY_FIELDS = ('summary', 'description', 'content', 'media_content', 'media_thumbnail', 'enclosures')
+
+
+def _entry_fields(e):
+    # Plain, picklable copy of the entry fields _process_entry() reads
+    out = {}
+    for k in _ENTRY_FIELDS:
+        v = e.get(k)
+        out[k] = [dict(x) for x in v] if isinstance(v, list) else v
+    return out
+
+
+def _process_entry(entry):
+    # Runs in a worker process: HTML cleanup + TextRank + image lookup
+    desc = entry.get('summary') or entry.get('description') or ''
+    # Parse the summary once for both the text and the <img> fallback
+    tree = HTMLParser(desc) if HTMLParser is not None and desc else None
+    text = clean_text(desc, tree)
+    return summarize_text(text, sentences=2), first_image(entry, tree)
+
+
+def collect_category(category, feeds, feed_cache, item_cache):
+    """Turn one category's fetched feeds into Article items.
+
+    Returns (items, pending, fresh). Items missing from item_cache are left
+    with an empty summary and listed in pending, so main() can summarize every
+    category's new entries in one process-pool batch.
+    """
+    items   = []
+    pending = []      # (item, entry fields) not found in item_cache
+    fresh   = []      # (url, feed, feed_items) to store in feed_cache
+    seen_links = set()  # feeds in one category often syndicate the same story
+    for url, feed in feeds:
+        cached = feed_cache.get(url)
+        if feed.get('status') == 304:
+            # Unchanged since last build — reuse the items we normalized then.
+            # A 304 with nothing cached (server ignoring our request headers)
+            # has no body to fall back on, so the feed is skipped this run.
+            for i in (cached['entries'] if cached else ()):
+                key = _link_key(i['link']) if i['link'] else None
+                if key and key in seen_links:
+                    continue
+                seen_links.add(key)
+                items.append(Article(**i))
             continue
+        source = feed.feed.get('title', 'Unknown')
+        feed_items = []
         for e in feed.entries[:12]:
-            title   = e.get('title', 'Untitled')
-            link    = e.get('link', '')
-            source  = feed.feed.get('title', 'Unknown')
-            text    = clean_text(e.get('summary') or e.get('description') or '')
-            summary = summarize_text(text, sentences=2)
-            img     = first_image(e)
-            ts      = parse_time(e)
-            items.append({
-                'title': title, 'link': link, 'source': source,
-                'summary': summary, 'image': img, 'ts': ts,
-                'date': fmt_date(ts), 'category': category, 'commentary': '',
-                'is_editorial': False
-            })
-    items.sort(key=lambda x: x['ts'], reverse=True)
-
-    meta = dict(META_MAP.get(category, {
-        'title': category, 'description': category,
-        'h1': category, 'h2': '', 'slug': slugify(category)
-    }))
-    if 'slug' not in meta:
-        meta['slug'] = slugify(category)
-
+            link = e.get('link', '')
+            if link:
+                key = _link_key(link)
+                if key in seen_links:
+                    continue
+                seen_links.add(key)
+            ts   = parse_time(e)
+            item = Article(
+                title=e.get('title', 'Untitled'), link=link, source=source,
+                summary='', image=None, ts=ts, date=fmt_date(ts), category=category,
+            )
+            hit = item_cache.get(_item_key(link)) if link else None
+            if hit:
+                item.summary, item.image = hit['summary'], hit['image']
+            else:
+                pending.append((item, _entry_fields(e)))
+            feed_items.append(item)
+        fresh.append((url, feed, feed_items))
+        items.extend(feed_items)
+    return items, pending, fresh
+
+
+def build_category(category, items, fresh, editorial_articles, feed_cache, item_cache, build_sigs):
+    now = time.time()
+    for item in items:
+        if item.link:
+            item_cache[_item_key(item.link)] = {
+                'title': item.title, 'source': item.source,
+                'summary': item.summary, 'image': item.image,
+                'ts': item.ts, 'seen': now,
+            }
+    for url, feed, feed_items in fresh:
+        if feed_items:
+            feed_cache[url] = {
+                'etag': feed.get('etag'), 'modified': feed.get('modified'),
+                'entries': [asdict(i) for i in feed_items],
+            }
+    items.sort(key=_BY_TS, reverse=True)
+
+    meta = _CATEGORY_META[category]
     cat_slug = meta['slug']
     items = assign_unique_images(items, cat_slug)
 
@@ -350,10 +756,15 @@ def build_category(category, urls, editorial_articles):
         if a.get('cat_slug') == cat_slug
     ][:3]
 
-    html = CATEGORY_TPL.render(meta=meta, cards=items, cat_editorial=cat_editorial)
-    out  = os.path.join(SITE, f"{meta['slug']}.html")
-    with open(out, 'w', encoding='utf-8') as f:
-        f.write(html)
+    out = os.path.join(SITE, f"{meta['slug']}.html")
+    sig = _page_sig(CATEGORY_TPL_SRC_SIG, meta, items, cat_editorial)
+    if build_sigs.get(cat_slug) == sig and os.path.exists(out):
+        print(f'  Unchanged {meta["slug"]}.html  ({len(items)} items) — skipped render')
+        return items
+    build_sigs[cat_slug] = sig
+
+    # dump(path, encoding) writes encoded chunks straight to a binary file
+    CATEGORY_TPL.stream(meta=meta, cards=items, cat_editorial=cat_editorial).dump(out, encoding='utf-8')
     print(f'  Built {meta["slug"]}.html  ({len(items)} items, {len(cat_editorial)} editorial)')
     return items
 
@@ -373,37 +784,28 @@ def build_home(category_map, editorial_articles):
         'EVs & Automotive',
     ]
 
+    # Each category's items are already sorted newest-first, so merge the
+    # top-3 slices instead of re-sorting. Ties keep CATEGORY_ORDER priority.
+    top3 = [category_map.get(cat, [])[:3] for cat in CATEGORY_ORDER]
+    top3 += [items[:3] for cat, items in category_map.items() if cat not in CATEGORY_ORDER]
+
     all_cards = []
     seen = set()
-
-    for cat in CATEGORY_ORDER:
-        items = category_map.get(cat, [])
-        for item in items[:3]:
-            if item['link'] not in seen:
-                all_cards.append(item)
-                seen.add(item['link'])
-
-    for cat, items in category_map.items():
-        if cat not in CATEGORY_ORDER:
-            for item in items[:3]:
-                if item['link'] not in seen:
-                    all_cards.append(item)
-                    seen.add(item['link'])
-
-    all_cards.sort(key=lambda x: x['ts'], reverse=True)
+    for item in heapq.merge(*top3, key=_BY_TS, reverse=True):
+        if item.link not in seen:
+            all_cards.append(item)
+            seen.add(item.link)
 
     # Top 6 editorial articles for homepage highlights
     home_editorial = editorial_articles[:6]
 
     meta = dict(META_MAP['Home'])
-    html = HOME_TPL.render(
+    HOME_TPL.stream(
         meta=meta,
         featured=[],
         cards=all_cards[:27],
         editorial_articles=home_editorial
-    )
-    with open(os.path.join(SITE, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(html)
+    ).dump(os.path.join(SITE, 'index.html'), encoding='utf-8')
     print(f'  Built index.html  (grid={len(all_cards[:27])}, editorial={len(home_editorial)})')
 
 
@@ -522,17 +924,45 @@ def main():
     editorial_articles = load_editorial_articles()
     print(f'Loaded {len(editorial_articles)} editorial articles from generated_articles.json')
 
-    print('Syncing static assets from site/ to docs/…')
-    sync_static_assets()
+    feed_cache = load_json_cache(FEED_CACHE)
+    item_cache = load_json_cache(ITEM_CACHE)
+    build_sigs = load_json_cache(BUILD_SIGS)
+
+    # Copying site/ → docs/ is disk-bound and fetching is network-bound, so
+    # overlap them; both are done before any page is written.
+    print(f'Syncing static assets from site/ to docs/ and fetching {sum(len(u) for u in FEEDS.values())} feeds…')
+    with ThreadPoolExecutor(max_workers=1) as bg:
+        synced = bg.submit(sync_static_assets)
+        fetched = fetch_feeds(FEEDS, feed_cache)
+        synced.result()
 
     print('Building Tech Brief…')
+    collected = {
+        cat: collect_category(cat, feeds, feed_cache, item_cache)
+        for cat, feeds in fetched.items()
+    }
+    # Summarize new entries from every category in one batch so the worker
+    # pool stays busy instead of draining at the end of each category
+    pending = [p for _, cat_pending, _ in collected.values() for p in cat_pending]
+    if pending:
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(_process_entry, [fields for _, fields in pending], chunksize=16)
+            for (item, _), (summary, img) in zip(pending, results):
+                item.summary, item.image = summary, img
+
     category_map = {}
-    for cat, urls in FEEDS.items():
-        print(f'Fetching: {cat}')
-        category_map[cat] = build_category(cat, urls, editorial_articles)
+    for cat, (items, _, fresh) in collected.items():
+        category_map[cat] = build_category(
+            cat, items, fresh, editorial_articles, feed_cache, item_cache, build_sigs)
 
     build_home(category_map, editorial_articles)
     build_sitemap(editorial_articles)
+    # Drop validators for feeds no longer listed in feeds.json
+    configured = {url for urls in FEEDS.values() for url in urls}
+    save_json_cache(FEED_CACHE, {u: v for u, v in feed_cache.items() if u in configured})
+    prune_item_cache(item_cache, time.time())
+    save_json_cache(ITEM_CACHE, item_cache)
+    save_json_cache(BUILD_SIGS, build_sigs)
     print('Build complete.')
 
 
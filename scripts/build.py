@@ -37,11 +37,30 @@ GROQ OPTIMISATION RULES (from editorial brief):
   - High CPC keywords woven in naturally
 """
 
-import os, json, re, time, hashlib, requests
+import os, json, re, time, hashlib, heapq, functools, operator, shutil, requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html import unescape
+from urllib.parse import urlparse, urlsplit, parse_qsl, urlencode
 import feedparser
 from bs4 import BeautifulSoup
+try:
+    from lxml import etree as lxml_etree, html as lxml_html  # libxml2 in C; bs4 is only the fallback
+    _LXML_ERRORS = (lxml_etree.ParserError, ValueError)    # fragments lxml refuses; bs4 still reads them
+except ImportError:
+    lxml_html = None
+try:
+    import orjson  # Rust-backed; ~10x faster than json on the 40 MB article cache
+    def _json_loads(data): return orjson.loads(data)
+    # OPT_INDENT_2 matches json.dump(indent=2, ensure_ascii=False) byte for byte,
+    # so the committed caches don't churn when orjson is missing or present
+    def _json_dumps(obj): return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data): return json.loads(data)
+    def _json_dumps(obj): return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 from slugify import slugify as _slugify
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from datetime import datetime, timezone
 
 # ── Paths ──────────────────────────────────────────────────────────────────
@@ -49,9 +68,12 @@ ROOT       = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 DATA_FILE  = os.path.join(ROOT, 'data', 'feeds.json')
 META_FILE  = os.path.join(ROOT, 'data', 'meta.json')
 CACHE_FILE = os.path.join(ROOT, 'data', 'article_cache.json')
+FEED_CACHE_FILE = os.path.join(ROOT, 'data', 'rss_feed_cache.json')   # url → etag/modified/items
+PAGE_SIGS_FILE  = os.path.join(ROOT, 'data', 'page_sigs.json')        # page → fingerprint of its render inputs
 GEN_FILE   = os.path.join(ROOT, 'data', 'generated_articles.json')
 SITE_SRC   = os.path.join(ROOT, 'site')
 SITE_OUT   = os.path.join(ROOT, 'docs')
+JINJA_CACHE = os.path.join(ROOT, '.jinja_cache')
 SITE_URL   = 'https://www.thetechbrief.net'
 GA_TAG     = 'G-YCJEGDPW7G'
 
@@ -63,16 +85,33 @@ GROQ_URL             = 'https://api.groq.com/openai/v1/chat/completions'
 MODEL                = 'llama3-70b-8192'
 MAX_REWRITES_PER_RUN = 40
 CACHE_MAX_AGE_DAYS   = 60
+FETCH_WORKERS        = 16
+FETCH_TIMEOUT        = 10   # seconds; a stalled feed must not hang the build
+USER_AGENT           = 'TheTechBrief/1.0 (+https://www.thetechbrief.net)'
 
 # ── Load templates & data ──────────────────────────────────────────────────
 def _read(path):
-    with open(path, 'r', encoding='utf-8') as f:
+    with open(path, 'rb') as f:
         return f.read()
 
-CATEGORY_TPL = Template(_read(os.path.join(ROOT, 'site', 'template_category.html')))
-HOME_TPL     = Template(_read(os.path.join(ROOT, 'site', 'template_home.html')))
-FEEDS        = json.loads(_read(DATA_FILE))
-META_MAP     = json.loads(_read(META_FILE))
+# Compiled template bytecode persists in .jinja_cache/ (restored by CI)
+os.makedirs(JINJA_CACHE, exist_ok=True)
+# trim/lstrip_blocks drop the blank lines left by standalone {% %} lines
+JINJA_ENV    = Environment(loader=FileSystemLoader(SITE_SRC),
+                           bytecode_cache=FileSystemBytecodeCache(JINJA_CACHE),
+                           auto_reload=False, trim_blocks=True, lstrip_blocks=True)
+CATEGORY_TPL = JINJA_ENV.get_template('template_category.html')
+HOME_TPL     = JINJA_ENV.get_template('template_home.html')
+# Page-skip salt: template source + Environment options + this file's code, so a
+# change to any of them re-renders pages signed before it
+with open(__file__, 'rb') as f: _BUILD_CODE = f.read()
+_ENV_OPTS    = repr((JINJA_ENV.trim_blocks, JINJA_ENV.lstrip_blocks, JINJA_ENV.keep_trailing_newline,
+                     JINJA_ENV.newline_sequence, JINJA_ENV.autoescape)).encode('utf-8')
+_TPL_SIGS    = {name: hashlib.blake2b(JINJA_ENV.loader.get_source(JINJA_ENV, name)[0].encode('utf-8') + _ENV_OPTS + _BUILD_CODE,
+                                      digest_size=16).hexdigest()
+                for name in ('template_category.html', 'template_home.html')}
+FEEDS        = _json_loads(_read(DATA_FILE))
+META_MAP     = _json_loads(_read(META_FILE))
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -156,7 +195,7 @@ _IMAGE_POOLS = {
 
 def _pick_image(cat_slug: str, seed: str) -> str:
     pool = _IMAGE_POOLS.get(cat_slug, _IMAGE_POOLS['ai-news'])
-    idx  = int(hashlib.md5(seed.encode()).hexdigest(), 16) % len(pool)
+    idx  = int.from_bytes(hashlib.blake2b(seed.encode(), digest_size=8).digest(), 'big') % len(pool)
     return f'https://images.unsplash.com/{pool[idx]}?w=800&q=80'
 
 
@@ -184,9 +223,29 @@ _CAT_CLOSINGS = {
 }
 _DEFAULT_CLOSING = 'The pace of change in this sector demands continuous monitoring and proactive adaptation from every stakeholder.'
 
+@functools.lru_cache(maxsize=None)
+def _slug(category: str) -> str:
+    return _slugify(category)
+
+def _category_meta(category: str) -> dict:
+    meta = META_MAP.get(category)
+    if meta is None: meta = {'title': category, 'description': category, 'h1': category, 'h2': ''}
+    meta = dict(meta)
+    meta.setdefault('slug', _slug(category))
+    return meta
+
+# Page metadata per feed category, resolved once rather than per build_category call
+_CATEGORY_META = {cat: _category_meta(cat) for cat in FEEDS}
+
+# ── Precompiled patterns (hot per-entry / per-Groq-call paths) ─────────────
+_NON_WORD_RE    = re.compile(r'[^a-zA-Z0-9\s]')
+_FENCE_OPEN_RE  = re.compile(r'^```(?:json)?\s*', re.MULTILINE)
+_FENCE_CLOSE_RE = re.compile(r'\s*```$')
+_QUOTE_TRIM_RE  = re.compile(r'^["\'\\s]+|["\'\\s]+$')
+_TOPIC_STOPWORDS = frozenset({'the','a','an','of','in','on','at','to','for','with','by','as','is','are','was','were','has','have','had','will','would','could','should','that','this','these','those','and','or','but','not','from','into','over','after','before','about'})
+
 def _extract_topic(title: str) -> str:
-    stop = {'the','a','an','of','in','on','at','to','for','with','by','as','is','are','was','were','has','have','had','will','would','could','should','that','this','these','those','and','or','but','not','from','into','over','after','before','about'}
-    words = [w for w in re.sub(r'[^a-zA-Z0-9\s]', '', title).split() if w.lower() not in stop and len(w) > 3]
+    words = [w for w in _NON_WORD_RE.sub('', title).split() if w.lower() not in _TOPIC_STOPWORDS and len(w) > 3]
     return ' '.join(words[:4]) if words else 'technology'
 
 def local_fallback_summary(title: str, category: str, seed: str) -> str:
@@ -204,16 +263,21 @@ def local_fallback_summary(title: str, category: str, seed: str) -> str:
 def _url_key(url: str) -> str:
     return hashlib.md5(url.encode()).hexdigest()[:16]
 
-def load_cache() -> dict:
-    if os.path.exists(CACHE_FILE):
-        try: return json.loads(_read(CACHE_FILE))
+def load_cache(path: str = CACHE_FILE) -> dict:
+    if os.path.exists(path):
+        try: return _json_loads(_read(path))
         except Exception: pass
     return {}
 
-def save_cache(cache: dict):
-    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+def save_cache(cache: dict, path: str = CACHE_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_json_dumps(cache))
+
+def _page_sig(*parts) -> str:
+    """Fingerprint of everything a page render depends on (except build_ts)."""
+    blob = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.blake2b(blob.encode('utf-8'), digest_size=16).hexdigest()
 
 def _is_cache_fresh(entry: dict) -> bool:
     try:
@@ -298,8 +362,8 @@ Return ONLY this JSON structure (no markdown, no fences):
 
     raw = _groq_post(_INTELLIGENCE_SYSTEM, user, max_tokens=800)
     if not raw: return None
-    raw = re.sub(r'^```(?:json)?\s*', '', raw, flags=re.MULTILINE)
-    raw = re.sub(r'\s*```$', '', raw.strip()).strip()
+    raw = _FENCE_OPEN_RE.sub('', raw)
+    raw = _FENCE_CLOSE_RE.sub('', raw.strip()).strip()
     try:
         data = json.loads(raw)
         required = {'exec_summary', 'why_it_matters', 'editorial_body'}
@@ -328,7 +392,7 @@ def rewrite_via_groq(title: str, category: str) -> str | None:
             "confident analytical tone. End with one forward-looking sentence.\n\nReturn ONLY the paragraph.")
     text = _groq_post(system, user, 400)
     if text:
-        text = re.sub(r'^["\'\\s]+|["\'\\s]+$', '', text).strip()
+        text = _QUOTE_TRIM_RE.sub('', text).strip()
         return text if len(text) > 80 else None
     return None
 
@@ -386,8 +450,8 @@ def _groq_trending_article(title: str, category: str) -> dict | None:
     )
     raw = _groq_post(system, user, max_tokens=1000)
     if not raw: return None
-    raw = re.sub(r'^```(?:json)?\s*', '', raw, flags=re.MULTILINE)
-    raw = re.sub(r'\s*```$', '', raw.strip()).strip()
+    raw = _FENCE_OPEN_RE.sub('', raw)
+    raw = _FENCE_CLOSE_RE.sub('', raw.strip()).strip()
     try:
         data = json.loads(raw)
         required = {'headline', 'intro', 'body', 'conclusion', 'summary'}
@@ -418,23 +482,29 @@ def _local_trending_fallback(title: str, category: str, seed: str) -> dict:
     }
 
 
-def build_trending():
-    """Generate 6 trending articles every build run. Writes to docs/assets/data/."""
+def build_trending(fetched: dict, feed_cache: dict):
+    """Generate 6 trending articles every build run. Writes to docs/assets/data/.
+    Feeds come from the shared parallel fetch (see fetch_all_feeds)."""
     print('  Building trending articles…')
     today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
     stories = []
     for feed_cfg in _TRENDING_FEEDS:
+        url  = feed_cfg['url']
+        feed = fetched.get(url)
+        if feed is None: continue
         try:
-            feed = feedparser.parse(feed_cfg['url'])
-            for entry in feed.entries[:2]:
-                t = (entry.get('title') or '').strip()
-                l = (entry.get('link') or '').strip()
+            cached = feed_cache.get(url)
+            if feed.get('status') == 304 and cached:
+                entries = [(r['title'], r['link'], r['ts']) for r in cached['items'][:2]]
+            else:
+                entries = [((e.get('title') or '').strip(), (e.get('link') or '').strip(), parse_time(e))
+                           for e in feed.entries[:2]]
+            for t, l, ts in entries:
                 if t and l and len(t) > 20:
-                    ts = entry.get('published_parsed') or entry.get('updated_parsed')
-                    stories.append({'title': t, 'link': l, 'cat': feed_cfg['cat'], 'slug': feed_cfg['slug'], 'ts': time.mktime(ts) if ts else 0})
+                    stories.append({'title': t, 'link': l, 'cat': feed_cfg['cat'], 'slug': feed_cfg['slug'], 'ts': ts})
         except Exception: pass
 
-    stories.sort(key=lambda x: x['ts'], reverse=True)
+    stories.sort(key=_BY_TS, reverse=True)
     used_cats, selected = set(), []
     for s in stories:
         if s['slug'] not in used_cats and len(selected) < 6:
@@ -485,7 +555,6 @@ def build_trending():
         f.write('\n'.join(txt_lines))
     site_data_dir = os.path.join(SITE_SRC, 'assets', 'data')
     os.makedirs(site_data_dir, exist_ok=True)
-    import shutil
     shutil.copy2(json_path, os.path.join(site_data_dir, 'trending.json'))
     shutil.copy2(txt_path,  os.path.join(site_data_dir, 'trending.txt'))
     print(f'  ✓ trending.json + trending.txt written ({len(output)} stories)')
@@ -495,14 +564,39 @@ def build_trending():
 # RSS HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
-def clean_text(html_str):
-    txt = BeautifulSoup(html_str or '', 'html.parser').get_text(' ')
-    return re.sub(r'\s+', ' ', txt).strip()
+_IMG_EXTS = ('.jpg','.jpeg','.png','.webp','.gif')
 
 def _looks_like_image(url):
     if not url: return False
-    from urllib.parse import urlparse
-    return any(urlparse(url).path.lower().endswith(ext) for ext in ('.jpg','.jpeg','.png','.webp','.gif'))
+    # Plain string slicing; a full urlparse per candidate URL isn't needed.
+    # Like urlparse().path, the scheme and host are dropped first so that a
+    # bare host such as https://cdn.example.jpg doesn't count as an image.
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    head, sep, tail = path.partition('//')
+    if sep and (not head or head.endswith(':')): path = tail.partition('/')[2]
+    return path.lower().endswith(_IMG_EXTS)
+
+# First <img> tag and its src / data-src, found without building a soup.
+# Quoted attribute values may contain '>', so the tag only ends outside quotes.
+_IMG_TAG_RE      = re.compile(r'''<img\b(?:[^>"']|"[^"]*"|'[^']*')*>''', re.I)
+# Each quote style is matched on its own, so "it's.jpg" isn't cut at the '
+_IMG_SRC_RE      = re.compile(r'''(?<=\s)src\s*=\s*(?:"([^"]+)"|'([^']+)')''', re.I)
+_IMG_DATA_SRC_RE = re.compile(r'''(?<=\s)data-src\s*=\s*(?:"([^"]+)"|'([^']+)')''', re.I)
+
+def _img_src(html_str):
+    # First <img> with a usable src / data-src, in document order
+    for m in _IMG_TAG_RE.finditer(html_str):
+        tag = m.group(0)
+        a = _IMG_SRC_RE.search(tag) or _IMG_DATA_SRC_RE.search(tag)
+        if a: return unescape(a.group(1) or a.group(2))
+        # Unquoted or otherwise odd attributes: let a real parser read just this tag
+        try: img = lxml_html.fragment_fromstring(tag) if lxml_html is not None else None
+        except _LXML_ERRORS: img = None
+        if img is None:
+            img = BeautifulSoup(tag, 'html.parser').find('img')
+        src = (img.get('src') or img.get('data-src')) if img is not None else None
+        if src: return src
+    return None
 
 def first_image(entry):
     for m in (entry.get('media_content') or []):
@@ -512,26 +606,23 @@ def first_image(entry):
     for e in (entry.get('enclosures') or []):
         url = e.get('href') or e.get('url')
         if _looks_like_image(url) or 'image' in (e.get('type') or ''): return url
-    for c in (entry.get('content') or []):
-        img = BeautifulSoup(c.get('value',''), 'html.parser').find('img')
-        if img:
-            src = img.get('src') or img.get('data-src')
-            if src: return src
-    desc = entry.get('summary') or entry.get('description') or ''
-    if desc:
-        img = BeautifulSoup(desc, 'html.parser').find('img')
-        if img:
-            src = img.get('src') or img.get('data-src')
-            if src: return src
-    return None
+    # One scan over the <content> blocks and then the summary, instead of
+    # a separate pass per block; empty or blank fragments are dropped so an
+    # entry without any HTML skips the scan altogether
+    blocks = [c.get('value') for c in (entry.get('content') or [])]
+    blocks.append(entry.get('summary') or entry.get('description'))
+    blocks = [b for b in blocks if b and not b.isspace()]
+    return _img_src(' '.join(blocks)) if blocks else None
 
 SAFE_DOMAINS = ('images.unsplash.com','images.pexels.com','cdn.pixabay.com','upload.wikimedia.org')
+_SAFE_HOSTS    = frozenset(SAFE_DOMAINS)
+_SAFE_SUFFIXES = tuple('.' + d for d in SAFE_DOMAINS)
 
 def is_safe_image(url):
     if not url: return False
-    from urllib.parse import urlparse
-    h = urlparse(url).netloc.lower().lstrip('www.')
-    return any(h == d or h.endswith('.'+d) for d in SAFE_DOMAINS)
+    h = urlparse(url).netloc.lower()
+    if h.startswith('www.'): h = h[4:]
+    return h in _SAFE_HOSTS or h.endswith(_SAFE_SUFFIXES)
 
 def safe_image(url, cat_slug, seed):
     return url if is_safe_image(url) else _pick_image(cat_slug, seed)
@@ -540,15 +631,25 @@ def parse_time(entry):
     t = entry.get('published_parsed') or entry.get('updated_parsed')
     return time.mktime(t) if t else 0
 
-def fmt_date(ts):
-    return time.strftime('%B %d, %Y', time.localtime(ts)) if ts else ''
+_BY_TS = operator.itemgetter('ts')
+
+# Cache per 15-minute slot: every UTC offset is a multiple of 15 minutes,
+# so a slot never straddles a local midnight.
+_DATE_SLOT = 900
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_date_slot(slot, fmt):
+    return time.strftime(fmt, time.localtime(slot * _DATE_SLOT))
+
+def fmt_date(ts, fmt='%B %d, %Y'):
+    return _fmt_date_slot(int(ts // _DATE_SLOT), fmt) if ts else ''
 
 def today_str():
     return datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
 def load_editorial_articles() -> list:
     if not os.path.exists(GEN_FILE): return []
-    try: return json.loads(_read(GEN_FILE))
+    try: return _json_loads(_read(GEN_FILE))
     except Exception: return []
 
 
@@ -556,19 +657,45 @@ def load_editorial_articles() -> list:
 # STATIC ASSET SYNC
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _sync_file(src: str, dst: str, st: os.stat_result = None) -> bool:
+    """Copy src over dst if dst is missing, a different size or older. Returns True if copied."""
+    st = st or os.stat(src)
+    try:
+        d = os.stat(dst)
+        if d.st_size == st.st_size and d.st_mtime_ns >= st.st_mtime_ns: return False
+    except FileNotFoundError: pass
+    shutil.copyfile(src, dst)
+    return True
+
+def _sync_tree(src: str, dst: str) -> int:
+    """Incremental rmtree + copytree: same end state, but unchanged files aren't re-copied. Returns files copied."""
+    os.makedirs(dst, exist_ok=True)
+    seen, copied = set(), 0
+    with os.scandir(src) as it:
+        for entry in it:
+            seen.add(entry.name)
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False): copied += _sync_tree(entry.path, target)
+            else: copied += _sync_file(entry.path, target, entry.stat())
+    for name in os.listdir(dst):
+        if name in seen: continue
+        path = os.path.join(dst, name)
+        if os.path.isdir(path) and not os.path.islink(path): shutil.rmtree(path)
+        else: os.remove(path)
+    return copied
+
 def sync_static_assets():
-    import shutil
+    copied = 0
     for d in ['assets', 'legal', 'articles']:
         src = os.path.join(SITE_SRC, d)
-        dst = os.path.join(SITE_OUT, d)
         if os.path.isdir(src):
-            if os.path.exists(dst): shutil.rmtree(dst)
-            shutil.copytree(src, dst)
+            copied += _sync_tree(src, os.path.join(SITE_OUT, d))
     for fname in ['about.html', 'contact.html', 'how-to.html', 'robots.txt',
                   'sitemap.xml', 'template_category.html', 'template_home.html']:
         src = os.path.join(SITE_SRC, fname)
         if os.path.isfile(src):
-            shutil.copy2(src, os.path.join(SITE_OUT, fname))
+            copied += _sync_file(src, os.path.join(SITE_OUT, fname))
+    print(f'  {copied} static file(s) updated')
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -819,31 +946,125 @@ def build_internal_article_page(title, editorial_summary, category, cat_slug, ca
 </html>"""
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# FEED FETCHING — every category feed downloaded concurrently up front
+# ══════════════════════════════════════════════════════════════════════════════
+
+# One pooled session for all feed downloads: keep-alive reuses the TCP/TLS
+# connection for feeds sharing a host, and requests asks for gzip by default
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = USER_AGENT
+_SESSION.mount('https://', HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS * 2))
+_SESSION.mount('http://',  HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS * 2))
+
+def _fetch_feed(url: str, cached: dict = None):
+    # Conditional GET: an unchanged feed answers 304 with no body to parse
+    cached, headers = cached or {}, {}
+    if cached.get('etag'):     headers['If-None-Match']     = cached['etag']
+    if cached.get('modified'): headers['If-Modified-Since'] = cached['modified']
+    try:
+        r = _SESSION.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+        if r.status_code == 304:
+            return feedparser.FeedParserDict(status=304, entries=[])
+        r.raise_for_status()
+        # content-location gives feedparser the base URL for relative links
+        resp_headers = {k.lower(): v for k, v in r.headers.items()}
+        resp_headers['content-location'] = r.url
+        feed = feedparser.parse(r.content, response_headers=resp_headers)
+        feed['status'], feed['etag'], feed['modified'] = r.status_code, r.headers.get('ETag'), r.headers.get('Last-Modified')
+        return feed
+    except Exception as ex:
+        print(f'    Feed error {url}: {ex}')
+        return None
+
+def fetch_all_feeds(feeds: dict, feed_cache: dict, extra_urls=()) -> dict:
+    """Fetch every RSS URL in parallel (I/O-bound). Returns {url: parsed feed or None}."""
+    urls = list(dict.fromkeys([u for cat_urls in feeds.values() for u in cat_urls] + list(extra_urls)))
+    if not urls: return {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as ex:
+        return dict(zip(urls, ex.map(lambda u: _fetch_feed(u, feed_cache.get(u)), urls)))
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # CATEGORY PAGE BUILDER — V3: passes richer context to template
 # ══════════════════════════════════════════════════════════════════════════════
 
-def build_category(category: str, urls: list, editorial_articles: list, cache: dict, rewrites_done: list) -> list:
-    raw_items = []
-    for url in urls:
+@dataclass(slots=True)
+class Card:
+    """One rendered RSS card. Templates read it as article.title etc., which
+    Jinja resolves on attributes exactly as it did on the old dict keys."""
+    title: str
+    summary: str
+    image: str
+    internal_url: str
+    ts: float
+    date: str
+    pub_date: str
+    pub_date_fmt: str
+    url: str
+    image_url: str
+    category: str
+    cat_slug: str
+    read_time: str
+
+_CARD_BY_TS = operator.attrgetter('ts')
+
+def _link_key(link: str) -> str:
+    """Dedupe key for a story link: lowercased host + path + query, minus scheme, fragment, trailing / and utm_* params."""
+    u = urlsplit(link)
+    q = urlencode([kv for kv in parse_qsl(u.query, keep_blank_values=True) if not kv[0].startswith('utm_')]) if u.query else ''
+    return f"{u.netloc.lower()}{u.path.rstrip('/')}?{q}"
+
+def build_category(category: str, feeds: list, editorial_articles: list, cache: dict, rewrites_done: list, feed_cache: dict, page_sigs: dict) -> list:
+    # Dedupe by link while collecting (newest copy wins, first feed on a tie)
+    # so image extraction only runs for entries that make it onto the page
+    newest, recs_by_key = {}, {}
+    for url, feed in feeds:
+        if feed is None: continue
         try:
-            feed = feedparser.parse(url)
-            for e in feed.entries[:10]:
-                title = (e.get('title') or '').strip()
-                link  = (e.get('link') or '').strip()
-                if not title or not link: continue
-                raw_items.append({'title': title, 'link': link, 'image': first_image(e), 'ts': parse_time(e), 'date': fmt_date(parse_time(e))})
+            cached = feed_cache.get(url)
+            if feed.get('status') == 304 and cached:
+                # Unchanged since the last build: reuse the items stored then
+                pairs = [(rec, None) for rec in cached['items']]
+            else:
+                pairs = []
+                for e in feed.entries[:10]:
+                    title = (e.get('title') or '').strip()
+                    link  = (e.get('link') or '').strip()
+                    if not title or not link: continue
+                    pairs.append(({'title': title, 'link': link, 'ts': parse_time(e), 'image': None}, e))
+                # Only a clean, non-empty parse may back later 304s; otherwise keep
+                # the old validators so the next build fetches the body again
+                if pairs and not feed.get('bozo'):
+                    feed_cache[url] = {'etag': feed.get('etag'), 'modified': feed.get('modified'),
+                                       'items': [rec for rec, _ in pairs]}
+            for rec, e in pairs:
+                key = _link_key(rec['link'])
+                recs_by_key.setdefault(key, []).append(rec)
+                if key not in newest or rec['ts'] > newest[key][0]['ts']:
+                    newest[key] = (rec, e)
         except Exception as ex:
             print(f'    Feed error {url}: {ex}')
 
-    raw_items.sort(key=lambda x: x['ts'], reverse=True)
-    seen_links, deduped = set(), []
-    for item in raw_items:
-        if item['link'] not in seen_links:
-            deduped.append(item); seen_links.add(item['link'])
-
-    meta = dict(META_MAP.get(category, {'title': category, 'description': category, 'h1': category, 'h2': '', 'slug': _slugify(category)}))
-    if 'slug' not in meta: meta['slug'] = _slugify(category)
+    deduped = []
+    for key, (rec, e) in newest.items():
+        # Fresh entries get their image now, unless an earlier build already
+        # extracted it for this link; the record is shared with feed_cache,
+        # so a later 304 reuses it as-is
+        hit = cache.get(_url_key(rec['link']))
+        if e is not None:
+            rec['image'] = hit['image'] if hit and 'image' in hit else first_image(e)
+        elif rec['image'] is None and hit:
+            rec['image'] = hit.get('image')
+        # Dedupe losers are copies of the same story: give their cached records
+        # this image too, so a 304 replaying them without the winner has one
+        for other in recs_by_key[key]:
+            if other['image'] is None: other['image'] = rec['image']
+        deduped.append({'title': rec['title'], 'link': rec['link'], 'image': rec['image'],
+                        'ts': rec['ts'], 'date': fmt_date(rec['ts'])})
+    deduped.sort(key=_BY_TS, reverse=True)
+
+    meta = _CATEGORY_META[category]
     cat_slug = meta['slug']
     cat_page = f"{cat_slug}.html"
     os.makedirs(RSS_ARTICLES_OUT, exist_ok=True)
@@ -892,9 +1113,9 @@ def build_category(category: str, urls: list, editorial_articles: list, cache: d
                 'cached_on': datetime.now(timezone.utc).isoformat()
             }
 
+        cache[key]['image'] = item['image']   # raw feed image, reused by later builds
         image_url = safe_image(item.get('image'), cat_slug, slug)
-        try:    iso_date = time.strftime('%Y-%m-%d', time.strptime(item['date'], '%B %d, %Y')) if item['date'] else today_str()
-        except: iso_date = today_str()
+        iso_date  = fmt_date(item['ts'], '%Y-%m-%d') or today_str()
 
         article_html = build_internal_article_page(
             item['title'], editorial_summary, category, cat_slug,
@@ -903,27 +1124,36 @@ def build_category(category: str, urls: list, editorial_articles: list, cache: d
         with open(os.path.join(RSS_ARTICLES_OUT, f'{slug}.html'), 'w', encoding='utf-8') as f:
             f.write(article_html)
 
-        cards.append({
-            'title': item['title'],
-            'summary': editorial_summary,
-            'image': image_url,
-            'internal_url': f'articles/{slug}.html',
-            'ts': item['ts'],
-            'date': item['date'],
-            'pub_date': iso_date,
-            'pub_date_fmt': item['date'],
-            'url': f'articles/{slug}.html',
-            'image_url': image_url,
-            'category': category,
-            'cat_slug': cat_slug,
-            'read_time': f"{5 if intel_data else 4} min read",
-        })
+        cards.append(Card(
+            title=item['title'],
+            summary=editorial_summary,
+            image=image_url,
+            internal_url=f'articles/{slug}.html',
+            ts=item['ts'],
+            date=item['date'],
+            pub_date=iso_date,
+            pub_date_fmt=item['date'],
+            url=f'articles/{slug}.html',
+            image_url=image_url,
+            category=category,
+            cat_slug=cat_slug,
+            read_time=f"{5 if intel_data else 4} min read",
+        ))
 
     cat_editorial = [a for a in editorial_articles if a.get('cat_slug') == cat_slug][:3]
     cat_icon = _CAT_ICONS.get(cat_slug, '📰')
     build_ts = datetime.now(timezone.utc).strftime('%d %b %Y, %H:%M UTC')
 
-    html = CATEGORY_TPL.render(
+    # Same cards, deep-dives and template as the last build → keep the page
+    # (and its old build_ts) rather than re-rendering and re-committing it
+    out = os.path.join(SITE_OUT, cat_page)
+    sig = _page_sig(_TPL_SIGS['template_category.html'], meta, cards, cat_editorial, category, cat_icon)
+    if page_sigs.get(cat_page) == sig and os.path.exists(out):
+        print(f'  = {cat_page} unchanged — {len(cards)} cards, skipped render')
+        return cards
+    page_sigs[cat_page] = sig
+
+    CATEGORY_TPL.stream(
         meta=meta,
         articles=cards,
         editorial_articles=cat_editorial,
@@ -932,9 +1162,7 @@ def build_category(category: str, urls: list, editorial_articles: list, cache: d
         cat_icon=cat_icon,
         article_count=len(cards),
         build_ts=build_ts,
-    )
-    with open(os.path.join(SITE_OUT, f'{cat_slug}.html'), 'w', encoding='utf-8') as f:
-        f.write(html)
+    ).dump(out, encoding='utf-8')
 
     tier = f"Intel({rewrites_done[0]})" if GROQ_API_KEY else "local-fallback"
     print(f'  ✓ {cat_slug}.html — {len(cards)} cards [{tier}], {len(cat_editorial)} deep-dives')
@@ -945,19 +1173,29 @@ def build_category(category: str, urls: list, editorial_articles: list, cache: d
 # HOMEPAGE — V3: injects per-category article slices
 # ══════════════════════════════════════════════════════════════════════════════
 
-def build_home(editorial_articles: list, all_category_cards: dict):
+def build_home(editorial_articles: list, all_category_cards: dict, page_sigs: dict):
     meta = dict(META_MAP['Home'])
     build_ts = datetime.now(timezone.utc).strftime('%d %b %Y, %H:%M UTC')
 
-    # Collect top 3 across all categories (sorted by timestamp)
-    all_cards = []
-    for cards in all_category_cards.values():
-        all_cards.extend(cards)
-    all_cards.sort(key=lambda x: x.get('ts', 0), reverse=True)
-
-    html = HOME_TPL.render(
+    # Top 3 across all categories. Each category's cards are already newest-
+    # first, so merge lazily and stop at 3 instead of sorting every card;
+    # the seen set keeps a story filed under two categories from leading twice.
+    lead, seen = [], set()
+    for card in heapq.merge(*all_category_cards.values(), key=_CARD_BY_TS, reverse=True):
+        if card.url not in seen:
+            lead.append(card); seen.add(card.url)
+            if len(lead) == 3: break
+
+    out = os.path.join(SITE_OUT, 'index.html')
+    sig = _page_sig(_TPL_SIGS['template_home.html'], meta, lead, all_category_cards, editorial_articles[:9])
+    if page_sigs.get('index.html') == sig and os.path.exists(out):
+        print('  = index.html unchanged, skipped render')
+        return
+    page_sigs['index.html'] = sig
+
+    HOME_TPL.stream(
         meta=meta,
-        articles=all_cards[:3],
+        articles=lead,
         ai_articles=all_category_cards.get('AI News', [])[:3],
         cyber_articles=all_category_cards.get('Cybersecurity Updates', [])[:4],
         enterprise_articles=all_category_cards.get('Enterprise Tech', [])[:2],
@@ -968,10 +1206,8 @@ def build_home(editorial_articles: list, all_category_cards: dict):
         consumer_articles=all_category_cards.get('Consumer Tech', [])[:2],
         editorial_articles=editorial_articles[:9],
         build_ts=build_ts,
-    )
-    with open(os.path.join(SITE_OUT, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(html)
-    print(f'  ✓ index.html ({len(all_cards[:3])} lead articles, {len(editorial_articles[:9])} editorial)')
+    ).dump(out, encoding='utf-8')
+    print(f'  ✓ index.html ({len(lead)} lead articles, {len(editorial_articles[:9])} editorial)')
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1039,20 +1275,29 @@ def main():
     print(f'Groq: {"ENABLED — V3 Intelligence Pipeline" if GROQ_API_KEY else "DISABLED — local fallbacks active (never blank)"}')
 
     cache         = load_cache()
+    feed_cache    = load_cache(FEED_CACHE_FILE)
+    page_sigs     = load_cache(PAGE_SIGS_FILE)
     rewrites_done = [0]
 
-    print('Syncing static assets…')
-    sync_static_assets()
+    # The static copy is local disk I/O and the fetch is network-bound, so run
+    # them side by side; the sync must finish before anything under docs/
+    # is written, as it deletes files that are not in site/
+    print(f'Syncing static assets and fetching {sum(len(u) for u in FEEDS.values())} feeds…')
+    with ThreadPoolExecutor(max_workers=1) as bg:
+        synced  = bg.submit(sync_static_assets)
+        fetched = fetch_all_feeds(FEEDS, feed_cache, [f['url'] for f in _TRENDING_FEEDS])
+        synced.result()
     os.makedirs(RSS_ARTICLES_OUT, exist_ok=True)
 
     print('Building trending section…')
-    build_trending()
+    build_trending(fetched, feed_cache)
 
     print(f'Building {len(FEEDS)} category pages…')
     all_category_cards = {}
     for cat, urls in FEEDS.items():
         print(f'  [{cat}]')
-        cards = build_category(cat, urls, editorial_articles, cache, rewrites_done)
+        feeds = [(url, fetched.get(url)) for url in urls]
+        cards = build_category(cat, feeds, editorial_articles, cache, rewrites_done, feed_cache, page_sigs)
         all_category_cards[cat] = cards
 
     rss_slugs = [
@@ -1062,13 +1307,16 @@ def main():
     ] if os.path.isdir(RSS_ARTICLES_OUT) else []
 
     print('Building homepage…')
-    build_home(editorial_articles, all_category_cards)
+    build_home(editorial_articles, all_category_cards, page_sigs)
 
     print('Building sitemap…')
     build_sitemap(editorial_articles, rss_slugs)
 
     print(f'Saving cache ({len(cache)} entries)…')
     save_cache(cache)
+    save_cache(page_sigs, PAGE_SIGS_FILE)
+    # Only keep conditional-GET state for feeds that are still configured
+    save_cache({u: v for u, v in feed_cache.items() if u in fetched}, FEED_CACHE_FILE)
 
     print(f'\n✅ V3 Build complete')
     print(f'   Intelligence rewrites : {rewrites_done[0]}')
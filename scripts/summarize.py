@@ -1,37 +1,89 @@
 """
 summarize.py  —  Text summarisation helper for The Tech Brief build pipeline.
 
-Uses sumy TextRank with NLTK punkt tokenizer.
+Uses sumy TextRank with NLTK punkt tokenizer for long texts and a cheap
+word-frequency ranking for mid-length ones.
 Falls back to sentence-split truncation if sumy/nltk unavailable.
 """
 
+import heapq
 import re
+from collections import Counter
+
+try:
+    from sumy.parsers.plaintext import PlaintextParser
+    from sumy.nlp.tokenizers import Tokenizer
+    from sumy.summarizers.text_rank import TextRankSummarizer
+    _SUMMARIZER = TextRankSummarizer()   # stateless, safe to share across calls
+    _SUMY_OK = True
+except Exception:
+    _SUMY_OK = False
+
+# Tokenizer(language) loads the NLTK punkt model, so build one per language
+_TOKENIZERS = {}
+
+
+def _tokenizer(language):
+    tok = _TOKENIZERS.get(language)
+    if tok is None:
+        tok = _TOKENIZERS[language] = Tokenizer(language)
+    return tok
+
+
+# Below this length (most RSS summaries) TextRank has too little text to
+# rank usefully; the lead sentences are as good and far cheaper
+SHORT_TEXT_CHARS = 600
+
+# Up to this length a word-frequency (Luhn-style) ranking picks sentences
+# about as well as TextRank, without building and iterating its graph
+FREQ_RANK_CHARS = 1000
+
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_STOPWORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his i if in "
+    "into is it its not of on or our she so than that the their them they this "
+    "to was we were what when which who will with would you your".split()
+)
+
+
+def _frequency_summary(parts, sentences):
+    """Pick the `sentences` sentences with the most frequent content words."""
+    words = [_WORD_RE.findall(p.lower()) for p in parts]
+    freq = Counter(w for ws in words for w in ws if w not in _STOPWORDS)
+    # Stopwords are absent from freq, so they score 0 without a second check
+    scores = [sum(freq[w] for w in ws) for ws in words]
+    top = heapq.nlargest(sentences, range(len(parts)), key=scores.__getitem__)
+    return " ".join(parts[i] for i in sorted(top))
 
 
 def summarize_text(text, sentences=2, language="english"):
     """
     Return a summary of `text` containing at most `sentences` sentences.
-    Tries sumy TextRank first; falls back to simple truncation on any error.
+    Tries sumy TextRank on long texts; falls back to simple truncation on any error.
     """
     text = (text or "").strip()
     if not text:
         return ""
 
-    try:
-        from sumy.parsers.plaintext import PlaintextParser
-        from sumy.nlp.tokenizers import Tokenizer
-        from sumy.summarizers.text_rank import TextRankSummarizer
-
-        parser = PlaintextParser.from_string(text, Tokenizer(language))
-        summarizer = TextRankSummarizer()
-        result = summarizer(parser.document, sentences)
-        if result:
-            return " ".join(str(s) for s in result)
-    except Exception:
-        pass
-
-    # Fallback: split on sentence boundaries and return first N
-    parts = re.split(r"(?<=[.!?])\s+", text)
+    # Short inputs: TextRank would just hand back the lead sentences, so
+    # skip its sentence-graph construction entirely.
+    parts = _SENT_RE.split(text)
+    if len(parts) <= sentences or len(text) < SHORT_TEXT_CHARS:
+        return " ".join(parts[:sentences])
+    if len(text) < FREQ_RANK_CHARS:
+        return _frequency_summary(parts, sentences)
+
+    if _SUMY_OK:
+        try:
+            parser = PlaintextParser.from_string(text, _tokenizer(language))
+            result = _SUMMARIZER(parser.document, sentences)
+            if result:
+                return " ".join(str(s) for s in result)
+        except Exception:
+            pass
+
+    # Fallback: return the first N sentences
     joined = " ".join(parts[:sentences])
     if joined:
         return joined